@@ -1,7 +1,7 @@
 from ruamel import yaml
 
 from .context import Context
-from .fields import fixed_fields
+from .fields import field_tables
 from .sources import KeySource, ValueSource, YAMLValue
 
 
@@ -98,11 +98,8 @@ def extract_unknown_fields(
     if context is None:
         context = Context()
 
-    # Get valid YAML field names from the dataclass (considering yaml_name metadata)
-    _fixed_fields = fixed_fields(dataclass_type)
-    yaml_field_names = {
-        field.metadata.get("yaml_name", fname) for fname, field in _fixed_fields.items()
-    }
+    # Map valid YAML field names to Python field names (considering yaml_name metadata)
+    yaml_to_field, _, _ = field_tables(dataclass_type)
 
     unknown_fields: dict[KeySource[str], ValueSource[YAMLValue]] = {}
 
@@ -111,11 +108,7 @@ def extract_unknown_fields(
         py_key = context.yaml_constructor.construct_yaml_str(key_node)
 
         # Check if it's an unknown field (not in valid YAML field names and not an extension)
-        if (
-            isinstance(py_key, str)
-            and py_key not in yaml_field_names
-            and not py_key.startswith("x-")
-        ):
+        if isinstance(py_key, str) and py_key not in yaml_to_field and not py_key.startswith("x-"):
             # Construct the actual Python value from the YAML node
             py_value = context.yaml_constructor.construct_object(value_node, deep=True)
 
@@ -1,8 +1,9 @@
 from dataclasses import MISSING, field, fields
-from typing import Any
+from functools import cache
+from typing import Any, get_args
 
 
-__all__ = ["fixed_field", "fixed_fields", "patterned_field", "patterned_fields"]
+__all__ = ["field_tables", "fixed_field", "fixed_fields", "patterned_field", "patterned_fields"]
 
 
 def fixed_field(*, default: Any = None, metadata: dict[str, Any] | None = None) -> Any:
@@ -23,6 +24,30 @@ def fixed_fields(dataclass_type: type) -> dict[str, Any]:
     return {f.name: f for f in fields(dataclass_type) if f.metadata.get("fixed_field")}
 
 
+@cache
+def field_tables(dataclass_type: type) -> tuple[dict[str, str], dict[str, frozenset[Any]], bool]:
+    """
+    Get the field lookup tables used to build a dataclass from a YAML mapping.
+
+    Field metadata is fixed once a dataclass is defined, so the tables are computed on the
+    first call for each type and reused afterwards. Callers must not mutate them.
+
+    Args:
+        dataclass_type: The dataclass type to inspect
+
+    Returns:
+        A tuple of the YAML name to Python field name mapping, the FieldSource type arguments
+        of each fixed field, and whether the dataclass has an `extensions` field
+    """
+    _fixed_fields = fixed_fields(dataclass_type)
+    yaml_to_field = {
+        f.metadata.get("yaml_name", fname): fname for fname, f in _fixed_fields.items()
+    }
+    field_type_args = {fname: frozenset(get_args(f.type)) for fname, f in _fixed_fields.items()}
+    has_extensions = any(f.name == "extensions" for f in fields(dataclass_type))
+    return yaml_to_field, field_type_args, has_extensions
+
+
 def patterned_field(
     *, default=MISSING, default_factory=MISSING, metadata: dict[str, Any] | None = None
 ) -> Any:
@@ -1,13 +1,11 @@
 """Builders for OpenAPI 3.0.x specification objects."""
 
-from dataclasses import fields
-from typing import TYPE_CHECKING, Any, TypeVar, cast, get_args
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ruamel import yaml
 
 from ...context import Context
-from ...extractors import extract_extension_fields
-from ...fields import fixed_fields
+from ...fields import field_tables
 from ...sources import FieldSource, KeySource, ValueSource, YAMLInvalidValue, YAMLValue
 
 
@@ -64,24 +62,28 @@ def build_model(
         value = context.yaml_constructor.construct_object(root, deep=True)
         return ValueSource(value=value, value_node=root)
 
-    # Get fixed specification fields for this dataclass type
-    _fixed_fields = fixed_fields(dataclass_type)
+    # Look up the field tables for this dataclass type (computed once per type)
+    yaml_to_field, field_type_args_by_name, has_extensions = field_tables(dataclass_type)
 
-    # Build YAML name to Python field name mapping
-    yaml_to_field = {
-        field.metadata.get("yaml_name", fname): fname for fname, field in _fixed_fields.items()
-    }
-
-    # Extract field values in a single pass (non-recursive, single layer only)
+    # Extract field values and extensions in a single pass (non-recursive, single layer only)
     field_values: dict[str, FieldSource[Any]] = {}
+    extensions: dict[KeySource[str], ValueSource[YAMLValue]] = {}
     for key_node, value_node in root.value:
         key = context.yaml_constructor.construct_yaml_str(key_node)
 
+        # Collect specification extensions (x-* fields) if the dataclass supports them
+        if isinstance(key, str) and key.startswith("x-"):
+            if has_extensions:
+                ext_value = context.yaml_constructor.construct_object(value_node, deep=True)
+                extensions[KeySource[str](value=key, key_node=key_node)] = ValueSource[YAMLValue](
+                    value=ext_value, value_node=value_node
+                )
+            continue
+
         # Map YAML key to Python field name
         field_name = yaml_to_field.get(key)
         if field_name:
-            field = _fixed_fields[field_name]
-            field_type_args = set(get_args(field.type))
+            field_type_args = field_type_args_by_name[field_name]
 
             if field_type_args & {
                 FieldSource[str],
@@ -277,14 +279,12 @@ def build_model(
 
     # Build and return the dataclass instance
     # Conditionally include extensions field if dataclass supports it
-    # Cast to Any to work around generic type constraints
-    has_extensions = any(f.name == "extensions" for f in fields(cast(Any, dataclass_type)))
     return cast(
         T,
         dataclass_type(
             root_node=root,  # type: ignore[call-arg]
             **field_values,
-            **({"extensions": extract_extension_fields(root, context)} if has_extensions else {}),
+            **({"extensions": extensions} if has_extensions else {}),
         ),
     )
 
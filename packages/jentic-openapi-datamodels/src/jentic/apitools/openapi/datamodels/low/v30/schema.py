@@ -1,11 +1,11 @@
 from dataclasses import dataclass, field, replace
-from typing import Any, TypeAlias, get_args
+from typing import Any, TypeAlias
 
 from ruamel import yaml
 
 from ..context import Context
 from ..extractors import extract_extension_fields
-from ..fields import fixed_field, fixed_fields
+from ..fields import field_tables, fixed_field
 from ..sources import FieldSource, KeySource, ValueSource, YAMLInvalidValue, YAMLValue
 from .builders import build_field_source
 from .discriminator import Discriminator
@@ -180,11 +180,8 @@ def build(
         value = context.yaml_constructor.construct_object(root, deep=True)
         return ValueSource(value=value, value_node=root)
 
-    # Build YAML name to Python field name mapping
-    _fixed_fields = fixed_fields(Schema)
-    yaml_to_field = {
-        f.metadata.get("yaml_name", fname): fname for fname, f in _fixed_fields.items()
-    }
+    # Look up the field tables for Schema (computed once per type)
+    yaml_to_field, field_type_args_by_name, _ = field_tables(Schema)
 
     # Accumulate all field values in a single pass
     field_values: dict[str, Any] = {}
@@ -202,8 +199,7 @@ def build(
             continue
 
         # Get field metadata
-        field_info = _fixed_fields[field_name]
-        field_type_args = set(get_args(field_info.type))
+        field_type_args = field_type_args_by_name[field_name]
 
         # Simple scalar fields (handled like build_model does)
         if field_type_args & {
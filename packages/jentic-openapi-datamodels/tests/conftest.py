@@ -1,6 +1,7 @@
 """Shared pytest fixtures for jentic-openapi-datamodels tests."""
 
 import pytest
+from ruamel.yaml import YAML
 
 from jentic.apitools.openapi.parser.backends.ruamel_ast import MappingNode
 from jentic.apitools.openapi.parser.core import OpenAPIParser
@@ -24,3 +25,17 @@ def parse_yaml():
         return parser.parse(yaml_content, return_type=MappingNode)
 
     return _parse
+
+
+@pytest.fixture(scope="session")
+def yaml_parser() -> YAML:
+    """Fixture that provides a shared round-trip YAML instance.
+
+    Use it to compose documents whose root is not a mapping (scalars, sequences),
+    which parse_yaml rejects.
+
+    Example:
+        def test_something(yaml_parser):
+            root = yaml_parser.compose("just-a-string")
+    """
+    return YAML()
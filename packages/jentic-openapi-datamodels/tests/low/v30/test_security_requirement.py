@@ -1,22 +1,27 @@
 """Tests for SecurityRequirement low-level datamodel."""
 
-import textwrap
-
-from ruamel.yaml import YAML
+import pytest
 
 from jentic.apitools.openapi.datamodels.low.context import Context
 from jentic.apitools.openapi.datamodels.low.sources import ValueSource
 from jentic.apitools.openapi.datamodels.low.v30 import security_requirement
 
 
+def _flatten_requirements(
+    result: security_requirement.SecurityRequirement,
+) -> dict[str, list[str]]:
+    """Map a built SecurityRequirement to plain scheme names and scope strings."""
+    return {k.value: [scope.value for scope in v.value] for k, v in result.requirements.items()}
+
+
+SINGLE_SCHEME_EMPTY_SCOPES_YAML = """
+api_key: []
+"""
+
+
 def test_build_with_single_scheme_empty_scopes(parse_yaml):
     """Test building SecurityRequirement with a single scheme and empty scopes."""
-    yaml_content = textwrap.dedent(
-        """
-        api_key: []
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SINGLE_SCHEME_EMPTY_SCOPES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -34,32 +39,27 @@ def test_build_with_single_scheme_empty_scopes(parse_yaml):
     assert len(scopes) == 0
 
 
+OAUTH2_SCOPES_YAML = """
+petstore_auth:
+  - write:pets
+  - read:pets
+"""
+
+
 def test_build_with_oauth2_scopes(parse_yaml):
     """Test building SecurityRequirement with OAuth2 scopes."""
-    yaml_content = textwrap.dedent(
-        """
-        petstore_auth:
-          - write:pets
-          - read:pets
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(OAUTH2_SCOPES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
 
     assert isinstance(result.requirements, dict)
 
-    # Extract scopes
-    requirements_dict = result.requirements
-    petstore_auth_key = None
-    for k in requirements_dict.keys():
-        if k.value == "petstore_auth":
-            petstore_auth_key = k
-            break
-
-    assert petstore_auth_key is not None
-    scopes_value_source = requirements_dict[petstore_auth_key]
+    # Index entries by scheme name
+    by_name = {k.value: (k, v) for k, v in result.requirements.items()}
+    assert "petstore_auth" in by_name
+    petstore_auth_key, scopes_value_source = by_name["petstore_auth"]
+    assert petstore_auth_key.key_node is not None
     assert isinstance(scopes_value_source, ValueSource)
 
     # Extract individual scope strings
@@ -67,17 +67,17 @@ def test_build_with_oauth2_scopes(parse_yaml):
     assert scopes == ["write:pets", "read:pets"]
 
 
+MULTIPLE_SCHEMES_YAML = """
+oauth2:
+  - read:data
+  - write:data
+api_key: []
+"""
+
+
 def test_build_with_multiple_schemes(parse_yaml):
     """Test building SecurityRequirement with multiple security schemes."""
-    yaml_content = textwrap.dedent(
-        """
-        oauth2:
-          - read:data
-          - write:data
-        api_key: []
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MULTIPLE_SCHEMES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -85,10 +85,7 @@ def test_build_with_multiple_schemes(parse_yaml):
     assert isinstance(result.requirements, dict)
     assert len(result.requirements) == 2
 
-    # Convert to dict for easier testing
-    requirements = {}
-    for k, v in result.requirements.items():
-        requirements[k.value] = [scope.value for scope in v.value]
+    requirements = _flatten_requirements(result)
 
     assert "oauth2" in requirements
     assert "api_key" in requirements
@@ -96,14 +93,14 @@ def test_build_with_multiple_schemes(parse_yaml):
     assert requirements["api_key"] == []
 
 
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
 def test_build_with_empty_object(parse_yaml):
     """Test building SecurityRequirement with empty object (optional security)."""
-    yaml_content = textwrap.dedent(
-        """
-        {}
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EMPTY_OBJECT_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -111,15 +108,15 @@ def test_build_with_empty_object(parse_yaml):
     assert len(result.requirements) == 0
 
 
+PRESERVES_INVALID_TYPES_YAML = """
+api_key: not-an-array
+oauth2: 123
+"""
+
+
 def test_build_preserves_invalid_types(parse_yaml):
     """Test that build preserves values even with 'wrong' types (low-level model principle)."""
-    yaml_content = textwrap.dedent(
-        """
-        api_key: not-an-array
-        oauth2: 123
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(PRESERVES_INVALID_TYPES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -136,35 +133,32 @@ def test_build_preserves_invalid_types(parse_yaml):
     assert requirements["oauth2"] == 123
 
 
-def test_build_with_invalid_node_returns_value_source():
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_value"),
+    [
+        pytest.param("just-a-string", "just-a-string", id="scalar"),
+        pytest.param("['item1', 'item2']", ["item1", "item2"], id="sequence"),
+    ],
+)
+def test_build_with_invalid_node_returns_value_source(yaml_parser, yaml_content, expected_value):
     """Test that build returns ValueSource for non-mapping nodes."""
-    yaml_parser = YAML()
-
-    # Scalar node
-    scalar_root = yaml_parser.compose("just-a-string")
-    result = security_requirement.build(scalar_root)
+    root = yaml_parser.compose(yaml_content)
+    result = security_requirement.build(root)
     assert isinstance(result, ValueSource)
-    assert result.value == "just-a-string"
-    assert result.value_node == scalar_root
+    assert result.value == expected_value
+    assert result.value_node == root
 
-    # Sequence node
-    sequence_root = yaml_parser.compose("['item1', 'item2']")
-    result = security_requirement.build(sequence_root)
-    assert isinstance(result, ValueSource)
-    assert result.value == ["item1", "item2"]
-    assert result.value_node == sequence_root
+
+CUSTOM_CONTEXT_YAML = """
+custom_auth:
+  - scope1
+  - scope2
+"""
 
 
 def test_build_with_custom_context(parse_yaml):
     """Test building SecurityRequirement with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        custom_auth:
-          - scope1
-          - scope2
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = security_requirement.build(root, context=custom_context)
@@ -172,24 +166,21 @@ def test_build_with_custom_context(parse_yaml):
 
     assert isinstance(result.requirements, dict)
 
-    # Extract scopes
-    requirements = {}
-    for k, v in result.requirements.items():
-        requirements[k.value] = [scope.value for scope in v.value]
+    requirements = _flatten_requirements(result)
 
     assert requirements["custom_auth"] == ["scope1", "scope2"]
 
 
+SOURCE_TRACKING_YAML = """
+petstore_auth:
+  - write:pets
+  - read:pets
+"""
+
+
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        petstore_auth:
-          - write:pets
-          - read:pets
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -197,13 +188,12 @@ def test_source_tracking(parse_yaml):
     # Check that the requirements dict is present
     assert isinstance(result.requirements, dict)
 
-    # Check that keys are wrapped
-    for key in result.requirements.keys():
+    for key, value in result.requirements.items():
+        # Check that keys are wrapped
         assert key.key_node is not None
         assert key.value == "petstore_auth"
 
-    # Check that scope arrays are wrapped
-    for value in result.requirements.values():
+        # Check that scope arrays are wrapped
         assert isinstance(value, ValueSource)
         assert value.value_node is not None
 
@@ -213,46 +203,43 @@ def test_source_tracking(parse_yaml):
             assert scope.value_node is not None
 
 
+COMPLEX_OAUTH_SCOPES_YAML = """
+google_oauth:
+  - https://www.googleapis.com/auth/userinfo.email
+  - https://www.googleapis.com/auth/userinfo.profile
+  - openid
+"""
+
+
 def test_complex_oauth_scopes(parse_yaml):
     """Test SecurityRequirement with complex OAuth scope patterns."""
-    yaml_content = textwrap.dedent(
-        """
-        google_oauth:
-          - https://www.googleapis.com/auth/userinfo.email
-          - https://www.googleapis.com/auth/userinfo.profile
-          - openid
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(COMPLEX_OAUTH_SCOPES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
 
     assert isinstance(result.requirements, dict)
 
-    # Extract scopes
-    requirements = {}
-    for k, v in result.requirements.items():
-        requirements[k.value] = [scope.value for scope in v.value]
+    requirements = _flatten_requirements(result)
 
     assert len(requirements["google_oauth"]) == 3
     assert "https://www.googleapis.com/auth/userinfo.email" in requirements["google_oauth"]
     assert "openid" in requirements["google_oauth"]
 
 
+MULTIPLE_REQUIREMENTS_DIFFERENT_TYPES_YAML = """
+bearer_token: []
+oauth2:
+  - read
+  - write
+api_key: []
+basic_auth: []
+"""
+
+
 def test_multiple_requirements_different_types(parse_yaml):
     """Test SecurityRequirement with mixed auth types."""
-    yaml_content = textwrap.dedent(
-        """
-        bearer_token: []
-        oauth2:
-          - read
-          - write
-        api_key: []
-        basic_auth: []
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MULTIPLE_REQUIREMENTS_DIFFERENT_TYPES_YAML)
 
     result = security_requirement.build(root)
     assert isinstance(result, security_requirement.SecurityRequirement)
@@ -260,10 +247,7 @@ def test_multiple_requirements_different_types(parse_yaml):
     assert isinstance(result.requirements, dict)
     assert len(result.requirements) == 4
 
-    # Extract all requirements
-    requirements = {}
-    for k, v in result.requirements.items():
-        requirements[k.value] = [scope.value for scope in v.value]
+    requirements = _flatten_requirements(result)
 
     # Check all schemes present
     assert "bearer_token" in requirements
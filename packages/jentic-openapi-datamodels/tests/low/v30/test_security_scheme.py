@@ -1,8 +1,6 @@
 """Tests for SecurityScheme low-level datamodel."""
 
-import textwrap
-
-from ruamel.yaml import YAML
+import pytest
 
 from jentic.apitools.openapi.datamodels.low.context import Context
 from jentic.apitools.openapi.datamodels.low.sources import FieldSource, ValueSource
@@ -10,161 +8,160 @@ from jentic.apitools.openapi.datamodels.low.v30 import security_scheme
 from jentic.apitools.openapi.datamodels.low.v30.oauth_flows import OAuthFlows
 
 
-def test_build_with_api_key_in_header(parse_yaml):
-    """Test building SecurityScheme with apiKey type in header."""
-    yaml_content = textwrap.dedent(
-        """
-        type: apiKey
-        name: X-API-Key
-        in: header
-        description: API key authentication
-        """
-    )
+API_KEY_IN_HEADER_YAML = """
+type: apiKey
+name: X-API-Key
+in: header
+description: API key authentication
+"""
+
+API_KEY_IN_QUERY_YAML = """
+type: apiKey
+name: api_key
+in: query
+"""
+
+API_KEY_IN_COOKIE_YAML = """
+type: apiKey
+name: session_token
+in: cookie
+"""
+
+HTTP_BASIC_YAML = """
+type: http
+scheme: basic
+description: HTTP Basic Authentication
+"""
+
+HTTP_BEARER_YAML = """
+type: http
+scheme: bearer
+bearerFormat: JWT
+description: Bearer token authentication with JWT
+"""
+
+MINIMAL_FIELDS_YAML = """
+type: http
+"""
+
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_fields"),
+    [
+        pytest.param(
+            API_KEY_IN_HEADER_YAML,
+            {
+                "type": "apiKey",
+                "name": "X-API-Key",
+                "in_": "header",
+                "description": "API key authentication",
+                "scheme": None,
+                "flows": None,
+                "openid_connect_url": None,
+            },
+            id="api-key-in-header",
+        ),
+        pytest.param(
+            API_KEY_IN_QUERY_YAML,
+            {"type": "apiKey", "name": "api_key", "in_": "query"},
+            id="api-key-in-query",
+        ),
+        pytest.param(
+            API_KEY_IN_COOKIE_YAML,
+            {"type": "apiKey", "name": "session_token", "in_": "cookie"},
+            id="api-key-in-cookie",
+        ),
+        pytest.param(
+            HTTP_BASIC_YAML,
+            {
+                "type": "http",
+                "scheme": "basic",
+                "description": "HTTP Basic Authentication",
+                "name": None,
+                "in_": None,
+                "bearer_format": None,
+                "flows": None,
+                "openid_connect_url": None,
+            },
+            id="http-basic",
+        ),
+        pytest.param(
+            HTTP_BEARER_YAML,
+            {
+                "type": "http",
+                "scheme": "bearer",
+                "bearer_format": "JWT",
+                "description": "Bearer token authentication with JWT",
+            },
+            id="http-bearer",
+        ),
+        pytest.param(
+            MINIMAL_FIELDS_YAML,
+            {"type": "http", "description": None, "scheme": None},
+            id="minimal-fields",
+        ),
+        pytest.param(
+            EMPTY_OBJECT_YAML,
+            {
+                "type": None,
+                "description": None,
+                "name": None,
+                "in_": None,
+                "scheme": None,
+                "bearer_format": None,
+                "flows": None,
+                "openid_connect_url": None,
+            },
+            id="empty-object",
+        ),
+    ],
+)
+def test_build_with_scalar_fields(parse_yaml, yaml_content, expected_fields):
+    """Test building SecurityScheme whose fields are plain scalar values or absent."""
     root = parse_yaml(yaml_content)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.root_node == root
 
-    # Check required fields for apiKey
-    assert isinstance(result.type, FieldSource)
-    assert result.name is not None
-    assert result.in_ is not None
-    assert result.description is not None
-    assert result.type.value == "apiKey"
-    assert result.name.value == "X-API-Key"
-    assert result.in_.value == "header"
-    assert result.description.value == "API key authentication"
-
-    # Other type-specific fields should be None
-    assert result.scheme is None
-    assert result.flows is None
-    assert result.openid_connect_url is None
-
-
-def test_build_with_api_key_in_query(parse_yaml):
-    """Test building SecurityScheme with apiKey type in query parameter."""
-    yaml_content = textwrap.dedent(
-        """
-        type: apiKey
-        name: api_key
-        in: query
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    assert result.type is not None
-    assert result.name is not None
-    assert result.in_ is not None
-    assert result.type.value == "apiKey"
-    assert result.name.value == "api_key"
-    assert result.in_.value == "query"
-
-
-def test_build_with_api_key_in_cookie(parse_yaml):
-    """Test building SecurityScheme with apiKey type in cookie."""
-    yaml_content = textwrap.dedent(
-        """
-        type: apiKey
-        name: session_token
-        in: cookie
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    assert result.type is not None
-    assert result.name is not None
-    assert result.in_ is not None
-    assert result.type.value == "apiKey"
-    assert result.name.value == "session_token"
-    assert result.in_.value == "cookie"
-
-
-def test_build_with_http_basic(parse_yaml):
-    """Test building SecurityScheme with HTTP Basic authentication."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        scheme: basic
-        description: HTTP Basic Authentication
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    assert result.type is not None
-    assert result.scheme is not None
-    assert result.description is not None
-    assert result.type.value == "http"
-    assert result.scheme.value == "basic"
-    assert result.description.value == "HTTP Basic Authentication"
-
-    # Other fields should be None
-    assert result.name is None
-    assert result.in_ is None
-    assert result.bearer_format is None
-    assert result.flows is None
-    assert result.openid_connect_url is None
-
-
-def test_build_with_http_bearer(parse_yaml):
-    """Test building SecurityScheme with HTTP Bearer token authentication."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        scheme: bearer
-        bearerFormat: JWT
-        description: Bearer token authentication with JWT
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    assert result.type is not None
-    assert result.scheme is not None
-    assert result.bearer_format is not None
-    assert result.description is not None
-    assert result.type.value == "http"
-    assert result.scheme.value == "bearer"
-    assert result.bearer_format.value == "JWT"
-    assert result.description.value == "Bearer token authentication with JWT"
+    for field_name, expected in expected_fields.items():
+        field = getattr(result, field_name)
+        if expected is None:
+            assert field is None, field_name
+        else:
+            assert isinstance(field, FieldSource), field_name
+            assert field.value == expected, field_name
+
+
+OAUTH2_YAML = """
+type: oauth2
+description: OAuth2 authentication
+flows:
+  implicit:
+    authorizationUrl: https://example.com/oauth/authorize
+    scopes:
+      read:pets: Read your pets
+      write:pets: Modify pets in your account
+  authorizationCode:
+    authorizationUrl: https://example.com/oauth/authorize
+    tokenUrl: https://example.com/oauth/token
+    scopes:
+      read:pets: Read your pets
+      write:pets: Modify pets in your account
+"""
 
 
 def test_build_with_oauth2(parse_yaml):
     """Test building SecurityScheme with OAuth2."""
-    yaml_content = textwrap.dedent(
-        """
-        type: oauth2
-        description: OAuth2 authentication
-        flows:
-          implicit:
-            authorizationUrl: https://example.com/oauth/authorize
-            scopes:
-              read:pets: Read your pets
-              write:pets: Modify pets in your account
-          authorizationCode:
-            authorizationUrl: https://example.com/oauth/authorize
-            tokenUrl: https://example.com/oauth/token
-            scopes:
-              read:pets: Read your pets
-              write:pets: Modify pets in your account
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(OAUTH2_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.description is not None
@@ -173,30 +170,28 @@ def test_build_with_oauth2(parse_yaml):
 
     # Check flows object
     assert isinstance(result.flows, FieldSource)
-    assert isinstance(result.flows.value, OAuthFlows)
+    assert type(result.flows.value) is OAuthFlows
     assert result.flows.value.implicit is not None
     assert result.flows.value.authorization_code is not None
 
     # Other fields should be None
-    assert result.name is None
-    assert result.in_ is None
-    assert result.scheme is None
-    assert result.openid_connect_url is None
+    for field_name in ("name", "in_", "scheme", "openid_connect_url"):
+        assert getattr(result, field_name) is None, field_name
+
+
+OPENID_CONNECT_YAML = """
+type: openIdConnect
+openIdConnectUrl: https://example.com/.well-known/openid-configuration
+description: OpenID Connect authentication
+"""
 
 
 def test_build_with_openid_connect(parse_yaml):
     """Test building SecurityScheme with OpenID Connect."""
-    yaml_content = textwrap.dedent(
-        """
-        type: openIdConnect
-        openIdConnectUrl: https://example.com/.well-known/openid-configuration
-        description: OpenID Connect authentication
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(OPENID_CONNECT_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.openid_connect_url is not None
@@ -206,51 +201,47 @@ def test_build_with_openid_connect(parse_yaml):
     assert result.description.value == "OpenID Connect authentication"
 
     # Other fields should be None
-    assert result.name is None
-    assert result.in_ is None
-    assert result.scheme is None
-    assert result.flows is None
+    for field_name in ("name", "in_", "scheme", "flows"):
+        assert getattr(result, field_name) is None, field_name
+
+
+EXTENSIONS_YAML = """
+type: http
+scheme: bearer
+x-custom-field: custom-value
+x-token-lifetime: 3600
+"""
 
 
 def test_build_with_extensions(parse_yaml):
     """Test building SecurityScheme with specification extensions."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        scheme: bearer
-        x-custom-field: custom-value
-        x-token-lifetime: 3600
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EXTENSIONS_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.extensions is not None
-    assert len(result.extensions) == 2
+    assert [(k.value, v.value) for k, v in result.extensions.items()] == [
+        ("x-custom-field", "custom-value"),
+        ("x-token-lifetime", 3600),
+    ]
+
 
-    # Extract extension values
-    extensions = {k.value: v.value for k, v in result.extensions.items()}
-    assert extensions["x-custom-field"] == "custom-value"
-    assert extensions["x-token-lifetime"] == 3600
+PRESERVES_INVALID_TYPES_YAML = """
+type: 123
+name: true
+in: ['not', 'a', 'string']
+scheme: null
+flows: not-a-mapping
+"""
 
 
 def test_build_preserves_invalid_types(parse_yaml):
     """Test that build preserves values even with 'wrong' types (low-level model principle)."""
-    yaml_content = textwrap.dedent(
-        """
-        type: 123
-        name: true
-        in: ['not', 'a', 'string']
-        scheme: null
-        flows: not-a-mapping
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(PRESERVES_INVALID_TYPES_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.name is not None
@@ -266,10 +257,8 @@ def test_build_preserves_invalid_types(parse_yaml):
     assert result.flows.value == "not-a-mapping"
 
 
-def test_build_with_invalid_node_returns_none():
+def test_build_with_invalid_node_returns_none(yaml_parser):
     """Test that build returns ValueSource for non-mapping nodes (preserves invalid data)."""
-    yaml_parser = YAML()
-
     # Scalar node
     scalar_root = yaml_parser.compose("just-a-string")
     result = security_scheme.build(scalar_root)
@@ -285,20 +274,20 @@ def test_build_with_invalid_node_returns_none():
     assert result.value_node == sequence_root
 
 
+CUSTOM_CONTEXT_YAML = """
+type: apiKey
+name: custom_key
+in: header
+"""
+
+
 def test_build_with_custom_context(parse_yaml):
     """Test building SecurityScheme with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        type: apiKey
-        name: custom_key
-        in: header
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = security_scheme.build(root, context=custom_context)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.name is not None
@@ -306,49 +295,46 @@ def test_build_with_custom_context(parse_yaml):
     assert result.name.value == "custom_key"
 
 
+SOURCE_TRACKING_YAML = """
+type: http
+scheme: bearer
+bearerFormat: JWT
+"""
+
+
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        scheme: bearer
-        bearerFormat: JWT
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.scheme is not None
     assert result.bearer_format is not None
 
     # Check that key_node and value_node are tracked
-    assert result.type.key_node is not None
-    assert result.type.value_node is not None
-    assert result.scheme.key_node is not None
-    assert result.scheme.value_node is not None
-    assert result.bearer_format.key_node is not None
-    assert result.bearer_format.value_node is not None
+    for field in (result.type, result.scheme, result.bearer_format):
+        assert field.key_node is not None
+        assert field.value_node is not None
 
     # Verify key_node contains correct field name
     assert result.type.key_node.value == "type"
     assert result.scheme.key_node.value == "scheme"
 
 
+NULL_FLOWS_YAML = """
+type: oauth2
+flows:
+"""
+
+
 def test_build_with_null_flows(parse_yaml):
     """Test building SecurityScheme with null flows value."""
-    yaml_content = textwrap.dedent(
-        """
-        type: oauth2
-        flows:
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(NULL_FLOWS_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.type.value == "oauth2"
@@ -356,40 +342,40 @@ def test_build_with_null_flows(parse_yaml):
     assert result.flows.value is None
 
 
+VALID_OAUTH2_FLOWS_YAML = """
+type: oauth2
+flows:
+  implicit:
+    authorizationUrl: https://example.com/oauth/authorize
+    scopes:
+      read: Read access
+  password:
+    tokenUrl: https://example.com/oauth/token
+    scopes:
+      write: Write access
+  clientCredentials:
+    tokenUrl: https://example.com/oauth/token
+    scopes:
+      admin: Admin access
+  authorizationCode:
+    authorizationUrl: https://example.com/oauth/authorize
+    tokenUrl: https://example.com/oauth/token
+    scopes:
+      full: Full access
+"""
+
+
 def test_build_with_valid_oauth2_flows(parse_yaml):
     """Test building SecurityScheme with complete OAuth2 flows."""
-    yaml_content = textwrap.dedent(
-        """
-        type: oauth2
-        flows:
-          implicit:
-            authorizationUrl: https://example.com/oauth/authorize
-            scopes:
-              read: Read access
-          password:
-            tokenUrl: https://example.com/oauth/token
-            scopes:
-              write: Write access
-          clientCredentials:
-            tokenUrl: https://example.com/oauth/token
-            scopes:
-              admin: Admin access
-          authorizationCode:
-            authorizationUrl: https://example.com/oauth/authorize
-            tokenUrl: https://example.com/oauth/token
-            scopes:
-              full: Full access
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(VALID_OAUTH2_FLOWS_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.type is not None
     assert result.flows is not None
     assert result.type.value == "oauth2"
-    assert isinstance(result.flows.value, OAuthFlows)
+    assert type(result.flows.value) is OAuthFlows
 
     # Verify all flows are present
     flows = result.flows.value
@@ -399,99 +385,69 @@ def test_build_with_valid_oauth2_flows(parse_yaml):
     assert flows.authorization_code is not None
 
 
+MARKDOWN_DESCRIPTION_YAML = """
+type: http
+scheme: bearer
+description: |
+  # Bearer Authentication
+
+  Use a JWT token in the Authorization header:
+
+  ```
+  Authorization: Bearer <token>
+  ```
+"""
+
+
 def test_build_with_markdown_description(parse_yaml):
     """Test building SecurityScheme with CommonMark description."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        scheme: bearer
-        description: |
-          # Bearer Authentication
-
-          Use a JWT token in the Authorization header:
-
-          ```
-          Authorization: Bearer <token>
-          ```
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MARKDOWN_DESCRIPTION_YAML)
 
     result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
+    assert type(result) is security_scheme.SecurityScheme
 
     assert result.description is not None
     assert "# Bearer Authentication" in result.description.value
     assert "Authorization: Bearer <token>" in result.description.value
 
 
-def test_build_with_minimal_fields(parse_yaml):
-    """Test building SecurityScheme with only required type field."""
-    yaml_content = textwrap.dedent(
-        """
-        type: http
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    assert result.type is not None
-    assert result.type.value == "http"
-    assert result.description is None
-    assert result.scheme is None
-
-
-def test_build_with_empty_object(parse_yaml):
-    """Test building SecurityScheme with empty object."""
-    yaml_content = textwrap.dedent(
-        """
-        {}
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = security_scheme.build(root)
-    assert isinstance(result, security_scheme.SecurityScheme)
-
-    # All fields should be None
-    assert result.type is None
-    assert result.description is None
-    assert result.name is None
-    assert result.in_ is None
-    assert result.scheme is None
-    assert result.bearer_format is None
-    assert result.flows is None
-    assert result.openid_connect_url is None
-
-
-def test_build_with_all_security_types(parse_yaml):
+ALL_SECURITY_TYPES_API_KEY_YAML = """
+type: apiKey
+name: api_key
+in: header
+"""
+
+ALL_SECURITY_TYPES_HTTP_YAML = """
+type: http
+scheme: basic
+"""
+
+ALL_SECURITY_TYPES_OAUTH2_YAML = """
+type: oauth2
+flows:
+  implicit:
+    authorizationUrl: https://example.com
+    scopes: {}
+"""
+
+ALL_SECURITY_TYPES_OPENID_CONNECT_YAML = """
+type: openIdConnect
+openIdConnectUrl: https://example.com/.well-known/openid-configuration
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_type"),
+    [
+        pytest.param(ALL_SECURITY_TYPES_API_KEY_YAML, "apiKey", id="api-key"),
+        pytest.param(ALL_SECURITY_TYPES_HTTP_YAML, "http", id="http"),
+        pytest.param(ALL_SECURITY_TYPES_OAUTH2_YAML, "oauth2", id="oauth2"),
+        pytest.param(ALL_SECURITY_TYPES_OPENID_CONNECT_YAML, "openIdConnect", id="openid-connect"),
+    ],
+)
+def test_build_with_all_security_types(parse_yaml, yaml_content, expected_type):
     """Test that we can build all four security scheme types correctly."""
-    # API Key
-    api_key_yaml = "type: apiKey\nname: api_key\nin: header"
-    api_key_result = security_scheme.build(parse_yaml(api_key_yaml))
-    assert isinstance(api_key_result, security_scheme.SecurityScheme)
-    assert api_key_result.type is not None
-    assert api_key_result.type.value == "apiKey"
-
-    # HTTP
-    http_yaml = "type: http\nscheme: basic"
-    http_result = security_scheme.build(parse_yaml(http_yaml))
-    assert isinstance(http_result, security_scheme.SecurityScheme)
-    assert http_result.type is not None
-    assert http_result.type.value == "http"
-
-    # OAuth2
-    oauth2_yaml = "type: oauth2\nflows:\n  implicit:\n    authorizationUrl: https://example.com\n    scopes: {}"
-    oauth2_result = security_scheme.build(parse_yaml(oauth2_yaml))
-    assert isinstance(oauth2_result, security_scheme.SecurityScheme)
-    assert oauth2_result.type is not None
-    assert oauth2_result.type.value == "oauth2"
-
-    # OpenID Connect
-    oidc_yaml = "type: openIdConnect\nopenIdConnectUrl: https://example.com/.well-known/openid-configuration"
-    oidc_result = security_scheme.build(parse_yaml(oidc_yaml))
-    assert isinstance(oidc_result, security_scheme.SecurityScheme)
-    assert oidc_result.type is not None
-    assert oidc_result.type.value == "openIdConnect"
+    result = security_scheme.build(parse_yaml(yaml_content))
+    assert type(result) is security_scheme.SecurityScheme
+    assert result.type is not None
+    assert result.type.value == expected_type
@@ -1,8 +1,8 @@
 """Tests for Server low-level datamodel."""
 
-import textwrap
+from typing import Any
 
-from ruamel.yaml import YAML
+import pytest
 from ruamel.yaml.comments import CommentedMap
 
 from jentic.apitools.openapi.datamodels.low.context import Context
@@ -11,109 +11,120 @@ from jentic.apitools.openapi.datamodels.low.v30 import server
 from jentic.apitools.openapi.datamodels.low.v30.server_variable import ServerVariable
 
 
-def test_build_with_url_only(parse_yaml):
-    """Test building Server with only required url field."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com/v1
-        """
-    )
+def _assert_field(field: object, expected: object) -> None:
+    """Assert that field is a FieldSource with tracked nodes and the expected value."""
+    assert isinstance(field, FieldSource)
+    assert field.key_node is not None
+    assert field.value_node is not None
+    assert field.value == expected
+
+
+def _extensions_by_name(result: server.Server) -> dict[str, Any]:
+    """Map a built Server's extensions to plain names and values."""
+    return {k.value: v.value for k, v in result.extensions.items()}
+
+
+URL_ONLY_YAML = """
+url: https://api.example.com/v1
+"""
+
+URL_AND_DESCRIPTION_YAML = """
+url: https://api.example.com
+description: Production API server
+"""
+
+RELATIVE_URL_YAML = """
+url: /api/v1
+description: Relative URL to API
+"""
+
+URL_VARIABLES_YAML = """
+url: https://{environment}.example.com/api/{version}
+description: API server with environment and version variables
+"""
+
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_fields"),
+    [
+        pytest.param(
+            URL_ONLY_YAML,
+            {"url": "https://api.example.com/v1", "description": None, "variables": None},
+            id="url-only",
+        ),
+        pytest.param(
+            URL_AND_DESCRIPTION_YAML,
+            {
+                "url": "https://api.example.com",
+                "description": "Production API server",
+                "variables": None,
+            },
+            id="url-and-description",
+        ),
+        pytest.param(
+            RELATIVE_URL_YAML,
+            {"url": "/api/v1", "description": "Relative URL to API", "variables": None},
+            id="relative-url",
+        ),
+        pytest.param(
+            URL_VARIABLES_YAML,
+            {
+                "url": "https://{environment}.example.com/api/{version}",
+                "description": "API server with environment and version variables",
+                "variables": None,
+            },
+            id="url-variables",
+        ),
+        pytest.param(
+            EMPTY_OBJECT_YAML,
+            {"url": None, "description": None, "variables": None},
+            id="empty-object",
+        ),
+    ],
+)
+def test_build_with_scalar_fields(parse_yaml, yaml_content, expected_fields):
+    """Test building Server whose fields are plain scalar values or absent."""
     root = parse_yaml(yaml_content)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.root_node == root
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://api.example.com/v1"
-    assert result.url.key_node is not None
-    assert result.url.value_node is not None
-
-    # Optional fields should be None
-    assert result.description is None
-    assert result.variables is None
     assert result.extensions == {}
 
+    for field_name, expected in expected_fields.items():
+        field = getattr(result, field_name)
+        if expected is None:
+            assert field is None, field_name
+        else:
+            assert isinstance(field, FieldSource), field_name
+            assert field.key_node is not None, field_name
+            assert field.value_node is not None, field_name
+            assert field.value == expected, field_name
 
-def test_build_with_url_and_description(parse_yaml):
-    """Test building Server with url and description."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        description: Production API server
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server.build(root)
-    assert isinstance(result, server.Server)
-
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://api.example.com"
-
-    assert isinstance(result.description, FieldSource)
-    assert result.description.value == "Production API server"
-
-    assert result.variables is None
-
-
-def test_build_with_relative_url(parse_yaml):
-    """Test building Server with relative URL."""
-    yaml_content = textwrap.dedent(
-        """
-        url: /api/v1
-        description: Relative URL to API
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server.build(root)
-    assert isinstance(result, server.Server)
 
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "/api/v1"
-    assert isinstance(result.description, FieldSource)
-    assert result.description.value == "Relative URL to API"
-
-
-def test_build_with_url_variables(parse_yaml):
-    """Test building Server with URL containing variables."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://{environment}.example.com/api/{version}
-        description: API server with environment and version variables
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server.build(root)
-    assert isinstance(result, server.Server)
-
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://{environment}.example.com/api/{version}"
-    assert "{environment}" in result.url.value
-    assert "{version}" in result.url.value
+SINGLE_VARIABLE_YAML = """
+url: https://{environment}.example.com/api
+description: API with environment variable
+variables:
+  environment:
+    default: production
+    description: The deployment environment
+"""
 
 
 def test_build_with_single_variable(parse_yaml):
     """Test building Server with a single server variable."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://{environment}.example.com/api
-        description: API with environment variable
-        variables:
-          environment:
-            default: production
-            description: The deployment environment
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SINGLE_VARIABLE_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://{environment}.example.com/api"
+    _assert_field(result.url, "https://{environment}.example.com/api")
     assert result.variables is not None
     assert isinstance(result.variables, FieldSource)
     assert isinstance(result.variables.value, dict)
@@ -133,42 +144,41 @@ def test_build_with_single_variable(parse_yaml):
     assert var_value.description.value == "The deployment environment"
 
 
+MULTIPLE_VARIABLES_YAML = """
+url: https://{environment}.example.com:{port}/api/{version}
+variables:
+  environment:
+    default: production
+    enum:
+      - production
+      - staging
+      - development
+  port:
+    default: "8443"
+  version:
+    default: v1
+    enum:
+      - v1
+      - v2
+"""
+
+
 def test_build_with_multiple_variables(parse_yaml):
     """Test building Server with multiple server variables."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://{environment}.example.com:{port}/api/{version}
-        variables:
-          environment:
-            default: production
-            enum:
-              - production
-              - staging
-              - development
-          port:
-            default: "8443"
-          version:
-            default: v1
-            enum:
-              - v1
-              - v2
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MULTIPLE_VARIABLES_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.variables is not None
     assert len(result.variables.value) == 3
 
-    # Extract variable names
-    var_names = {k.value for k in result.variables.value.keys()}
-    assert var_names == {"environment", "port", "version"}
+    # Index variables by name
+    by_name = {k.value: v for k, v in result.variables.value.items()}
+    assert by_name.keys() == {"environment", "port", "version"}
 
     # Check environment variable
-    env_key = next(k for k in result.variables.value.keys() if k.value == "environment")
-    env_var = result.variables.value[env_key]
+    env_var = by_name["environment"]
     assert isinstance(env_var, ServerVariable)
     assert env_var.default is not None
     assert env_var.default.value == "production"
@@ -176,68 +186,65 @@ def test_build_with_multiple_variables(parse_yaml):
     assert len(env_var.enum.value) == 3
 
     # Check port variable
-    port_key = next(k for k in result.variables.value.keys() if k.value == "port")
-    port_var = result.variables.value[port_key]
+    port_var = by_name["port"]
     assert isinstance(port_var, ServerVariable)
     assert port_var.default is not None
     assert port_var.default.value == "8443"
 
 
+ALL_FIELDS_YAML = """
+url: https://{environment}.example.com/api/v1
+description: Production API server with variable substitution
+variables:
+  environment:
+    default: production
+    enum:
+      - production
+      - staging
+    description: Deployment environment
+x-internal-id: server-001
+x-region: us-east-1
+"""
+
+
 def test_build_with_all_fields(parse_yaml):
     """Test building Server with all fields including extensions."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://{environment}.example.com/api/v1
-        description: Production API server with variable substitution
-        variables:
-          environment:
-            default: production
-            enum:
-              - production
-              - staging
-            description: Deployment environment
-        x-internal-id: server-001
-        x-region: us-east-1
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(ALL_FIELDS_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://{environment}.example.com/api/v1"
-    assert isinstance(result.description, FieldSource)
-    assert result.description.value == "Production API server with variable substitution"
+    _assert_field(result.url, "https://{environment}.example.com/api/v1")
+    _assert_field(result.description, "Production API server with variable substitution")
     assert result.variables is not None
     assert len(result.variables.value) == 1
 
     # Check extensions
     assert len(result.extensions) == 2
-    ext_dict = {k.value: v.value for k, v in result.extensions.items()}
+    ext_dict = _extensions_by_name(result)
     assert ext_dict["x-internal-id"] == "server-001"
     assert ext_dict["x-region"] == "us-east-1"
 
 
+COMMONMARK_DESCRIPTION_YAML = """
+url: https://api.example.com
+description: |
+  # Production API
+
+  This server hosts the **production** environment.
+
+  - High availability
+  - Load balanced
+  - Monitored 24/7
+"""
+
+
 def test_build_with_commonmark_description(parse_yaml):
     """Test that Server description can contain CommonMark formatted text."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        description: |
-          # Production API
-
-          This server hosts the **production** environment.
-
-          - High availability
-          - Load balanced
-          - Monitored 24/7
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(COMMONMARK_DESCRIPTION_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.description is not None
     assert "# Production API" in result.description.value
@@ -245,25 +252,8 @@ def test_build_with_commonmark_description(parse_yaml):
     assert "- High availability" in result.description.value
 
 
-def test_build_with_empty_object(parse_yaml):
-    """Test building Server from empty YAML object."""
-    yaml_content = "{}"
-    root = parse_yaml(yaml_content)
-
-    result = server.build(root)
-    assert isinstance(result, server.Server)
-
-    assert result.root_node == root
-    assert result.url is None
-    assert result.description is None
-    assert result.variables is None
-    assert result.extensions == {}
-
-
-def test_build_with_invalid_node_returns_value_source():
+def test_build_with_invalid_node_returns_value_source(yaml_parser):
     """Test that build returns ValueSource for non-mapping nodes."""
-    yaml_parser = YAML()
-
     # Scalar node
     scalar_root = yaml_parser.compose("https://api.example.com")
     result = server.build(scalar_root)
@@ -279,19 +269,19 @@ def test_build_with_invalid_node_returns_value_source():
     assert result.value_node == sequence_root
 
 
+PRESERVES_INVALID_TYPES_YAML = """
+url: 12345
+description: true
+variables: not-a-mapping
+"""
+
+
 def test_build_preserves_invalid_types(parse_yaml):
     """Test that build preserves values even with 'wrong' types."""
-    yaml_content = textwrap.dedent(
-        """
-        url: 12345
-        description: true
-        variables: not-a-mapping
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(PRESERVES_INVALID_TYPES_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     # Should preserve the actual values, not convert them
     assert result.url is not None
@@ -304,19 +294,19 @@ def test_build_preserves_invalid_types(parse_yaml):
     assert result.variables.value == "not-a-mapping"
 
 
+INVALID_VARIABLE_DATA_YAML = """
+url: https://api.example.com
+variables:
+  env: invalid-string-not-object
+"""
+
+
 def test_build_with_invalid_variable_data(parse_yaml):
     """Test that invalid variable data is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        variables:
-          env: invalid-string-not-object
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(INVALID_VARIABLE_DATA_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.variables is not None
     assert len(result.variables.value) == 1
@@ -329,41 +319,39 @@ def test_build_with_invalid_variable_data(parse_yaml):
     assert var_value.value == "invalid-string-not-object"
 
 
+CUSTOM_CONTEXT_YAML = """
+url: https://custom.example.com
+description: Custom context server
+"""
+
+
 def test_build_with_custom_context(parse_yaml):
     """Test building Server with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://custom.example.com
-        description: Custom context server
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = server.build(root, context=custom_context)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
+
+    _assert_field(result.url, "https://custom.example.com")
+    _assert_field(result.description, "Custom context server")
 
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://custom.example.com"
-    assert isinstance(result.description, FieldSource)
-    assert result.description.value == "Custom context server"
+
+SOURCE_TRACKING_YAML = """
+url: https://api.example.com
+description: Tracked server
+variables:
+  env:
+    default: prod
+"""
 
 
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        description: Tracked server
-        variables:
-          env:
-            default: prod
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     # Check url source tracking
     assert isinstance(result.url, FieldSource)
@@ -385,23 +373,23 @@ def test_source_tracking(parse_yaml):
     assert result.variables.key_node.value == "variables"
 
     # Check line numbers are available
-    assert hasattr(result.url.key_node.start_mark, "line")
-    assert hasattr(result.url.value_node.start_mark, "line")
+    assert isinstance(result.url.key_node.start_mark.line, int)
+    assert isinstance(result.url.value_node.start_mark.line, int)
+
+
+NULL_VALUES_YAML = """
+url: https://api.example.com
+description:
+variables:
+"""
 
 
 def test_build_with_null_values(parse_yaml):
     """Test that build preserves null values."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        description:
-        variables:
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(NULL_VALUES_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.url is not None
     assert result.description is not None
@@ -411,26 +399,26 @@ def test_build_with_null_values(parse_yaml):
     assert result.variables.value is None
 
 
+COMPLEX_EXTENSIONS_YAML = """
+url: https://api.example.com
+x-load-balancer:
+  type: round-robin
+  health-check: /health
+x-rate-limit:
+  requests: 1000
+  window: 60
+"""
+
+
 def test_build_with_complex_extensions(parse_yaml):
     """Test building Server with complex extension objects."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        x-load-balancer:
-          type: round-robin
-          health-check: /health
-        x-rate-limit:
-          requests: 1000
-          window: 60
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(COMPLEX_EXTENSIONS_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert len(result.extensions) == 2
-    ext_dict = {k.value: v.value for k, v in result.extensions.items()}
+    ext_dict = _extensions_by_name(result)
 
     # Check x-load-balancer extension
     load_balancer = ext_dict["x-load-balancer"]
@@ -445,44 +433,41 @@ def test_build_with_complex_extensions(parse_yaml):
     assert rate_limit["window"] == 60
 
 
+REAL_WORLD_EXAMPLE_YAML = """
+url: https://{username}.gigantic-server.com:{port}/{basePath}
+description: The production API server
+variables:
+  username:
+    default: demo
+    description: this value is assigned by the service provider, in this example `gigantic-server.com`
+  port:
+    enum:
+      - '8443'
+      - '443'
+    default: '8443'
+  basePath:
+    default: v2
+"""
+
+
 def test_build_real_world_example(parse_yaml):
     """Test a complete real-world Server object."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://{username}.gigantic-server.com:{port}/{basePath}
-        description: The production API server
-        variables:
-          username:
-            default: demo
-            description: this value is assigned by the service provider, in this example `gigantic-server.com`
-          port:
-            enum:
-              - '8443'
-              - '443'
-            default: '8443'
-          basePath:
-            default: v2
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(REAL_WORLD_EXAMPLE_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
-    assert isinstance(result.url, FieldSource)
-    assert result.url.value == "https://{username}.gigantic-server.com:{port}/{basePath}"
-    assert isinstance(result.description, FieldSource)
-    assert result.description.value == "The production API server"
+    _assert_field(result.url, "https://{username}.gigantic-server.com:{port}/{basePath}")
+    _assert_field(result.description, "The production API server")
 
     assert result.variables is not None
     assert len(result.variables.value) == 3
 
-    var_names = {k.value for k in result.variables.value.keys()}
-    assert var_names == {"username", "port", "basePath"}
+    by_name = {k.value: v for k, v in result.variables.value.items()}
+    assert by_name.keys() == {"username", "port", "basePath"}
 
     # Check username variable
-    username_key = next(k for k in result.variables.value.keys() if k.value == "username")
-    username_var = result.variables.value[username_key]
+    username_var = by_name["username"]
     assert isinstance(username_var, ServerVariable)
     assert username_var.default is not None
     assert username_var.default.value == "demo"
@@ -490,8 +475,7 @@ def test_build_real_world_example(parse_yaml):
     assert "gigantic-server.com" in username_var.description.value
 
     # Check port variable with enum
-    port_key = next(k for k in result.variables.value.keys() if k.value == "port")
-    port_var = result.variables.value[port_key]
+    port_var = by_name["port"]
     assert isinstance(port_var, ServerVariable)
     assert port_var.default is not None
     assert port_var.default.value == "8443"
@@ -501,22 +485,22 @@ def test_build_real_world_example(parse_yaml):
     assert port_enum_values == ["8443", "443"]
 
 
+VARIABLE_SOURCE_TRACKING_YAML = """
+url: https://api.example.com
+variables:
+  env:
+    default: production
+  region:
+    default: us-east-1
+"""
+
+
 def test_variable_source_tracking(parse_yaml):
     """Test that variables maintain proper source tracking."""
-    yaml_content = textwrap.dedent(
-        """
-        url: https://api.example.com
-        variables:
-          env:
-            default: production
-          region:
-            default: us-east-1
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(VARIABLE_SOURCE_TRACKING_YAML)
 
     result = server.build(root)
-    assert isinstance(result, server.Server)
+    assert type(result) is server.Server
 
     assert result.variables is not None
 
@@ -1,27 +1,25 @@
 """Tests for ServerVariable low-level datamodel."""
 
-import textwrap
-
-from ruamel.yaml import YAML
+import pytest
 
 from jentic.apitools.openapi.datamodels.low.context import Context
 from jentic.apitools.openapi.datamodels.low.sources import FieldSource, KeySource, ValueSource
 from jentic.apitools.openapi.datamodels.low.v30 import server_variable
 
 
+ALL_FIELDS_YAML = """
+default: production
+enum:
+  - production
+  - staging
+  - development
+description: The deployment environment
+"""
+
+
 def test_build_with_all_fields(parse_yaml):
     """Test building ServerVariable with all specification fields."""
-    yaml_content = textwrap.dedent(
-        """
-        default: production
-        enum:
-          - production
-          - staging
-          - development
-        description: The deployment environment
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(ALL_FIELDS_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -37,7 +35,7 @@ def test_build_with_all_fields(parse_yaml):
     # Check optional fields
     assert isinstance(result.enum, FieldSource)
     assert len(result.enum.value) == 3
-    assert all(isinstance(item, ValueSource) for item in result.enum.value)
+    assert {type(item) for item in result.enum.value} == {ValueSource}
     assert [item.value for item in result.enum.value] == ["production", "staging", "development"]
     assert result.enum.key_node is not None
     assert result.enum.value_node is not None
@@ -46,14 +44,14 @@ def test_build_with_all_fields(parse_yaml):
     assert result.description.value == "The deployment environment"
 
 
+DEFAULT_ONLY_YAML = """
+default: v1
+"""
+
+
 def test_build_with_default_only(parse_yaml):
     """Test building ServerVariable with only required default field."""
-    yaml_content = textwrap.dedent(
-        """
-        default: v1
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(DEFAULT_ONLY_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -69,37 +67,16 @@ def test_build_with_default_only(parse_yaml):
     assert result.extensions == {}
 
 
-def test_build_with_enum_values(parse_yaml):
-    """Test building ServerVariable with enum values."""
-    yaml_content = textwrap.dedent(
-        """
-        default: '8443'
-        enum:
-          - '8443'
-          - '443'
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server_variable.build(root)
-    assert isinstance(result, server_variable.ServerVariable)
-
-    assert result.default is not None
-    assert result.default.value == "8443"
-    assert result.enum is not None
-    assert [item.value for item in result.enum.value] == ["8443", "443"]
+EXTENSIONS_YAML = """
+default: api
+x-custom-property: custom-value
+x-internal: true
+"""
 
 
 def test_build_with_extensions(parse_yaml):
     """Test building ServerVariable with specification extensions (x-* fields)."""
-    yaml_content = textwrap.dedent(
-        """
-        default: api
-        x-custom-property: custom-value
-        x-internal: true
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EXTENSIONS_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -108,9 +85,8 @@ def test_build_with_extensions(parse_yaml):
     assert len(result.extensions) == 2
 
     # Extensions should be dict[KeySource, ValueSource]
-    keys = list(result.extensions.keys())
-    assert all(isinstance(k, KeySource) for k in keys)
-    assert all(isinstance(v, ValueSource) for v in result.extensions.values())
+    assert {type(k) for k in result.extensions} == {KeySource}
+    assert {type(v) for v in result.extensions.values()} == {ValueSource}
 
     # Check extension values
     ext_dict = {k.value: v.value for k, v in result.extensions.items()}
@@ -118,16 +94,16 @@ def test_build_with_extensions(parse_yaml):
     assert ext_dict["x-internal"] is True
 
 
+PRESERVES_INVALID_TYPES_YAML = """
+default: 12345
+enum: not-a-list
+description: 999
+"""
+
+
 def test_build_preserves_invalid_types(parse_yaml):
     """Test that build preserves values even with 'wrong' types (low-level model principle)."""
-    yaml_content = textwrap.dedent(
-        """
-        default: 12345
-        enum: not-a-list
-        description: 999
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(PRESERVES_INVALID_TYPES_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -142,10 +118,14 @@ def test_build_preserves_invalid_types(parse_yaml):
     assert result.description.value == 999
 
 
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
 def test_build_with_empty_object(parse_yaml):
     """Test building ServerVariable from empty YAML object."""
-    yaml_content = "{}"
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EMPTY_OBJECT_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -158,34 +138,31 @@ def test_build_with_empty_object(parse_yaml):
     assert result.extensions == {}
 
 
-def test_build_with_invalid_node_returns_value_source():
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_value"),
+    [
+        pytest.param("production", "production", id="scalar"),
+        pytest.param("['prod', 'staging']", ["prod", "staging"], id="sequence"),
+    ],
+)
+def test_build_with_invalid_node_returns_value_source(yaml_parser, yaml_content, expected_value):
     """Test that build returns ValueSource for non-mapping nodes (preserves invalid data)."""
-    yaml_parser = YAML()
-
-    # Scalar node
-    scalar_root = yaml_parser.compose("production")
-    result = server_variable.build(scalar_root)
+    root = yaml_parser.compose(yaml_content)
+    result = server_variable.build(root)
     assert isinstance(result, ValueSource)
-    assert result.value == "production"
-    assert result.value_node == scalar_root
+    assert result.value == expected_value
+    assert result.value_node == root
 
-    # Sequence node
-    sequence_root = yaml_parser.compose("['prod', 'staging']")
-    result = server_variable.build(sequence_root)
-    assert isinstance(result, ValueSource)
-    assert result.value == ["prod", "staging"]
-    assert result.value_node == sequence_root
+
+CUSTOM_CONTEXT_YAML = """
+default: localhost
+description: Local server
+"""
 
 
 def test_build_with_custom_context(parse_yaml):
     """Test building ServerVariable with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        default: localhost
-        description: Local server
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = server_variable.build(root, context=custom_context)
@@ -197,18 +174,18 @@ def test_build_with_custom_context(parse_yaml):
     assert result.description.value == "Local server"
 
 
+SOURCE_TRACKING_YAML = """
+default: api
+enum:
+  - api
+  - www
+description: Subdomain selection
+"""
+
+
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        default: api
-        enum:
-          - api
-          - www
-        description: Subdomain selection
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -232,7 +209,7 @@ def test_source_tracking(parse_yaml):
     assert result.default.value_node.value == "api"
     # Check individual enum items and their source tracking
     assert len(result.enum.value) == 2
-    assert all(isinstance(item, ValueSource) for item in result.enum.value)
+    assert {type(item) for item in result.enum.value} == {ValueSource}
     assert [item.value for item in result.enum.value] == ["api", "www"]
     # Each item should have source tracking
     assert result.enum.value[0].value_node.value == "api"
@@ -245,19 +222,19 @@ def test_source_tracking(parse_yaml):
     assert hasattr(result.default.value_node.start_mark, "line")
 
 
+MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML = """
+default: prod
+x-custom: value
+enum:
+  - prod
+  - dev
+x-another: 123
+"""
+
+
 def test_mixed_extensions_and_fixed_fields(parse_yaml):
     """Test that extensions and fixed fields are properly separated."""
-    yaml_content = textwrap.dedent(
-        """
-        default: prod
-        x-custom: value
-        enum:
-          - prod
-          - dev
-        x-another: 123
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -271,29 +248,28 @@ def test_mixed_extensions_and_fixed_fields(parse_yaml):
 
     # Extensions should be in extensions dict
     assert result.extensions is not None
-    assert len(result.extensions) == 2
+    assert [(k.value, v.value) for k, v in result.extensions.items()] == [
+        ("x-custom", "value"),
+        ("x-another", 123),
+    ]
 
-    ext_dict = {k.value: v.value for k, v in result.extensions.items()}
-    assert ext_dict["x-custom"] == "value"
-    assert ext_dict["x-another"] == 123
+
+COMMONMARK_DESCRIPTION_YAML = """
+default: v1
+description: |
+  # API Version
+
+  Choose the **API version** to use:
+  - `v1` - Current stable version
+  - `v2` - Beta version with new features
+
+  See [documentation](https://example.com/docs) for details.
+"""
 
 
 def test_commonmark_description(parse_yaml):
     """Test that description field can contain CommonMark formatted text."""
-    yaml_content = textwrap.dedent(
-        """
-        default: v1
-        description: |
-          # API Version
-
-          Choose the **API version** to use:
-          - `v1` - Current stable version
-          - `v2` - Beta version with new features
-
-          See [documentation](https://example.com/docs) for details.
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(COMMONMARK_DESCRIPTION_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -305,105 +281,85 @@ def test_commonmark_description(parse_yaml):
     assert "[documentation](https://example.com/docs)" in result.description.value
 
 
-def test_port_number_variables(parse_yaml):
-    """Test ServerVariable for port number substitution."""
-    yaml_content = textwrap.dedent(
-        """
-        default: '8443'
-        enum:
-          - '443'
-          - '8443'
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server_variable.build(root)
-    assert isinstance(result, server_variable.ServerVariable)
-
-    assert result.default is not None
-    assert result.default.value == "8443"
-    assert result.enum is not None
-    assert [item.value for item in result.enum.value] == ["443", "8443"]
-
-
-def test_protocol_variables(parse_yaml):
-    """Test ServerVariable for protocol substitution."""
-    yaml_content = textwrap.dedent(
-        """
-        default: https
-        enum:
-          - https
-          - http
-        description: The transfer protocol
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server_variable.build(root)
-    assert isinstance(result, server_variable.ServerVariable)
-
-    assert result.default is not None
-    assert result.default.value == "https"
-    assert result.enum is not None
-    assert [item.value for item in result.enum.value] == ["https", "http"]
-
-
-def test_version_variables(parse_yaml):
-    """Test ServerVariable for API version substitution."""
-    yaml_content = textwrap.dedent(
-        """
-        default: v2
-        enum:
-          - v1
-          - v2
-          - v3
-        description: API version
-        """
-    )
+ENUM_VALUES_YAML = """
+default: '8443'
+enum:
+  - '8443'
+  - '443'
+"""
+
+PORT_NUMBER_VARIABLES_YAML = """
+default: '8443'
+enum:
+  - '443'
+  - '8443'
+"""
+
+PROTOCOL_VARIABLES_YAML = """
+default: https
+enum:
+  - https
+  - http
+description: The transfer protocol
+"""
+
+VERSION_VARIABLES_YAML = """
+default: v2
+enum:
+  - v1
+  - v2
+  - v3
+description: API version
+"""
+
+ENVIRONMENT_VARIABLES_YAML = """
+default: production
+enum:
+  - development
+  - staging
+  - production
+description: The deployment environment
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_default", "expected_enum"),
+    [
+        pytest.param(ENUM_VALUES_YAML, "8443", ["8443", "443"], id="enum-values"),
+        pytest.param(PORT_NUMBER_VARIABLES_YAML, "8443", ["443", "8443"], id="port-number"),
+        pytest.param(PROTOCOL_VARIABLES_YAML, "https", ["https", "http"], id="protocol"),
+        pytest.param(VERSION_VARIABLES_YAML, "v2", ["v1", "v2", "v3"], id="version"),
+        pytest.param(
+            ENVIRONMENT_VARIABLES_YAML,
+            "production",
+            ["development", "staging", "production"],
+            id="environment",
+        ),
+    ],
+)
+def test_build_with_default_and_enum(parse_yaml, yaml_content, expected_default, expected_enum):
+    """Test building ServerVariable whose default is chosen from an enum of substitutions."""
     root = parse_yaml(yaml_content)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
 
     assert result.default is not None
-    assert result.default.value == "v2"
+    assert result.default.value == expected_default
     assert result.enum is not None
-    assert len(result.enum.value) == 3
+    assert [item.value for item in result.enum.value] == expected_enum
 
 
-def test_environment_variables(parse_yaml):
-    """Test ServerVariable for environment substitution."""
-    yaml_content = textwrap.dedent(
-        """
-        default: production
-        enum:
-          - development
-          - staging
-          - production
-        description: The deployment environment
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = server_variable.build(root)
-    assert isinstance(result, server_variable.ServerVariable)
-
-    assert result.default is not None
-    assert result.default.value == "production"
-    assert result.enum is not None
-    assert [item.value for item in result.enum.value] == ["development", "staging", "production"]
+NULL_VALUES_YAML = """
+default: default-value
+enum: null
+description:
+"""
 
 
 def test_null_values(parse_yaml):
     """Test handling of explicit null values."""
-    yaml_content = textwrap.dedent(
-        """
-        default: default-value
-        enum: null
-        description:
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(NULL_VALUES_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -419,15 +375,15 @@ def test_null_values(parse_yaml):
     assert result.description.value is None
 
 
+EMPTY_ENUM_ARRAY_YAML = """
+default: value
+enum: []
+"""
+
+
 def test_empty_enum_array(parse_yaml):
     """Test that empty enum arrays are preserved (even though spec says they SHOULD NOT be empty)."""
-    yaml_content = textwrap.dedent(
-        """
-        default: value
-        enum: []
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EMPTY_ENUM_ARRAY_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
@@ -439,17 +395,17 @@ def test_empty_enum_array(parse_yaml):
     assert result.enum.value == []
 
 
+DEFAULT_NOT_IN_ENUM_YAML = """
+default: prod
+enum:
+  - production
+  - staging
+"""
+
+
 def test_default_not_in_enum(parse_yaml):
     """Test that low-level model preserves default even when not in enum (validation layer's job)."""
-    yaml_content = textwrap.dedent(
-        """
-        default: prod
-        enum:
-          - production
-          - staging
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(DEFAULT_NOT_IN_ENUM_YAML)
 
     result = server_variable.build(root)
     assert isinstance(result, server_variable.ServerVariable)
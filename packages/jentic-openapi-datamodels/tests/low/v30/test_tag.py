@@ -1,8 +1,6 @@
 """Tests for Tag low-level datamodel."""
 
-import textwrap
-
-from ruamel.yaml import YAML
+from ruamel.yaml import SequenceNode
 
 from jentic.apitools.openapi.datamodels.low.context import Context
 from jentic.apitools.openapi.datamodels.low.sources import FieldSource, KeySource, ValueSource
@@ -12,18 +10,18 @@ from jentic.apitools.openapi.datamodels.low.v30.external_documentation import (
 )
 
 
+ALL_FIELDS_YAML = """
+name: pet
+description: Everything about your Pets
+externalDocs:
+  url: https://example.com/docs/pets
+  description: Find more info here
+"""
+
+
 def test_build_with_all_fields(parse_yaml):
     """Test building Tag with all specification fields."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        description: Everything about your Pets
-        externalDocs:
-          url: https://example.com/docs/pets
-          description: Find more info here
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(ALL_FIELDS_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -31,17 +29,17 @@ def test_build_with_all_fields(parse_yaml):
     assert result.root_node == root
 
     # Check name field
-    assert isinstance(result.name, FieldSource)
+    assert result.name is not None
     assert result.name.value == "pet"
     assert result.name.key_node is not None
     assert result.name.value_node is not None
 
     # Check description field
-    assert isinstance(result.description, FieldSource)
+    assert result.description is not None
     assert result.description.value == "Everything about your Pets"
 
     # Check externalDocs field
-    assert isinstance(result.external_docs, FieldSource)
+    assert result.external_docs is not None
     assert isinstance(result.external_docs.value, ExternalDocumentation)
     assert result.external_docs.value.url is not None
     assert result.external_docs.value.url.value == "https://example.com/docs/pets"
@@ -49,20 +47,20 @@ def test_build_with_all_fields(parse_yaml):
     assert result.external_docs.value.description.value == "Find more info here"
 
 
+MINIMAL_FIELDS_YAML = """
+name: pet
+"""
+
+
 def test_build_with_minimal_fields(parse_yaml):
     """Test building Tag with only required field (name)."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MINIMAL_FIELDS_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
 
     assert result.root_node == root
-    assert isinstance(result.name, FieldSource)
+    assert result.name is not None
     assert result.name.value == "pet"
 
     # Optional fields should be None
@@ -72,18 +70,18 @@ def test_build_with_minimal_fields(parse_yaml):
     assert result.extensions == {}
 
 
+EXTENSIONS_YAML = """
+name: pet
+description: Pet operations
+x-custom: custom-value
+x-internal: true
+x-order: 1
+"""
+
+
 def test_build_with_extensions(parse_yaml):
     """Test building Tag with specification extensions (x-* fields)."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        description: Pet operations
-        x-custom: custom-value
-        x-internal: true
-        x-order: 1
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EXTENSIONS_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -92,9 +90,8 @@ def test_build_with_extensions(parse_yaml):
     assert len(result.extensions) == 3
 
     # Extensions should be dict[KeySource, ValueSource]
-    keys = list(result.extensions.keys())
-    assert all(isinstance(k, KeySource) for k in keys)
-    assert all(isinstance(v, ValueSource) for v in result.extensions.values())
+    assert {type(k) for k in result.extensions} == {KeySource}
+    assert {type(v) for v in result.extensions.values()} == {ValueSource}
 
     # Check extension values
     ext_dict = {k.value: v.value for k, v in result.extensions.items()}
@@ -103,16 +100,16 @@ def test_build_with_extensions(parse_yaml):
     assert ext_dict["x-order"] == 1
 
 
+PRESERVES_INVALID_TYPES_YAML = """
+name: 12345
+description: true
+externalDocs: not-an-object
+"""
+
+
 def test_build_preserves_invalid_types(parse_yaml):
     """Test that build preserves values even with 'wrong' types (low-level model principle)."""
-    yaml_content = textwrap.dedent(
-        """
-        name: 12345
-        description: true
-        externalDocs: not-an-object
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(PRESERVES_INVALID_TYPES_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -130,10 +127,14 @@ def test_build_preserves_invalid_types(parse_yaml):
     assert result.external_docs.value == "not-an-object"
 
 
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
 def test_build_with_empty_object(parse_yaml):
     """Test building Tag from empty YAML object."""
-    yaml_content = "{}"
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EMPTY_OBJECT_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -146,10 +147,8 @@ def test_build_with_empty_object(parse_yaml):
     assert result.extensions == {}
 
 
-def test_build_with_invalid_node_returns_value_source():
+def test_build_with_invalid_node_returns_value_source(yaml_parser):
     """Test that build returns ValueSource for non-mapping nodes (preserves invalid data)."""
-    yaml_parser = YAML()
-
     # Scalar node
     scalar_root = yaml_parser.compose("pet")
     result = tag.build(scalar_root)
@@ -165,15 +164,15 @@ def test_build_with_invalid_node_returns_value_source():
     assert result.value_node == sequence_root
 
 
+CUSTOM_CONTEXT_YAML = """
+name: pet
+description: Pet operations
+"""
+
+
 def test_build_with_custom_context(parse_yaml):
     """Test building Tag with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        description: Pet operations
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = tag.build(root, context=custom_context)
@@ -185,15 +184,15 @@ def test_build_with_custom_context(parse_yaml):
     assert result.description.value == "Pet operations"
 
 
+SOURCE_TRACKING_YAML = """
+name: pet
+description: Everything about your Pets
+"""
+
+
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        description: Everything about your Pets
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -211,23 +210,23 @@ def test_source_tracking(parse_yaml):
     assert result.name.value_node.value == "pet"
 
     # Check line numbers are available (for error reporting)
-    assert hasattr(result.name.key_node.start_mark, "line")
-    assert hasattr(result.name.value_node.start_mark, "line")
+    assert isinstance(result.name.key_node.start_mark.line, int)
+    assert isinstance(result.name.value_node.start_mark.line, int)
+
+
+MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML = """
+name: pet
+x-custom: value
+description: Pet operations
+x-another: 123
+externalDocs:
+  url: https://example.com
+"""
 
 
 def test_mixed_extensions_and_fixed_fields(parse_yaml):
     """Test that extensions and fixed fields are properly separated."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        x-custom: value
-        description: Pet operations
-        x-another: 123
-        externalDocs:
-          url: https://example.com
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -243,30 +242,29 @@ def test_mixed_extensions_and_fixed_fields(parse_yaml):
 
     # Extensions should be in extensions dict
     assert result.extensions is not None
-    assert len(result.extensions) == 2
+    assert [(k.value, v.value) for k, v in result.extensions.items()] == [
+        ("x-custom", "value"),
+        ("x-another", 123),
+    ]
 
-    ext_dict = {k.value: v.value for k, v in result.extensions.items()}
-    assert ext_dict["x-custom"] == "value"
-    assert ext_dict["x-another"] == 123
+
+COMMONMARK_DESCRIPTION_YAML = """
+name: pet
+description: |
+  # Pet Operations
+
+  All operations related to **pets** in the store.
+
+  - Create pet
+  - Read pet
+  - Update pet
+  - Delete pet
+"""
 
 
 def test_commonmark_description(parse_yaml):
     """Test that description field can contain CommonMark formatted text."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        description: |
-          # Pet Operations
-
-          All operations related to **pets** in the store.
-
-          - Create pet
-          - Read pet
-          - Update pet
-          - Delete pet
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(COMMONMARK_DESCRIPTION_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -278,19 +276,19 @@ def test_commonmark_description(parse_yaml):
     assert "- Create pet" in result.description.value
 
 
+EXTERNAL_DOCS_WITH_EXTENSIONS_YAML = """
+name: pet
+externalDocs:
+  url: https://example.com/pets
+  description: Pet documentation
+  x-internal: true
+  x-version: "1.0"
+"""
+
+
 def test_external_docs_with_extensions(parse_yaml):
     """Test that externalDocs can have its own extensions."""
-    yaml_content = textwrap.dedent(
-        """
-        name: pet
-        externalDocs:
-          url: https://example.com/pets
-          description: Pet documentation
-          x-internal: true
-          x-version: "1.0"
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EXTERNAL_DOCS_WITH_EXTENSIONS_YAML)
 
     result = tag.build(root)
     assert isinstance(result, tag.Tag)
@@ -313,43 +311,34 @@ def test_external_docs_with_extensions(parse_yaml):
     assert ext_dict["x-version"] == "1.0"
 
 
-def test_multiple_tags():
+MULTIPLE_TAGS_YAML = """
+- name: pet
+  description: Everything about your Pets
+- name: store
+  description: Access to Petstore orders
+- name: user
+  description: Operations about user
+"""
+
+
+def test_multiple_tags(yaml_parser):
     """Test building multiple Tag objects (as would appear in OpenAPI spec)."""
-    yaml_content = textwrap.dedent(
-        """
-        - name: pet
-          description: Everything about your Pets
-        - name: store
-          description: Access to Petstore orders
-        - name: user
-          description: Operations about user
-        """
-    )
-    yaml_parser = YAML()
-    root = yaml_parser.compose(yaml_content)
+    root = yaml_parser.compose(MULTIPLE_TAGS_YAML)
 
     # Root is a sequence, so we need to iterate
-    assert hasattr(root, "value")  # SequenceNode has value attribute
+    assert isinstance(root, SequenceNode)
     tags = [tag.build(node) for node in root.value]
 
     assert len(tags) == 3
-    assert all(isinstance(t, tag.Tag) for t in tags)
-
-    # Type narrow for accessing Tag attributes
-    assert isinstance(tags[0], tag.Tag)
-    assert isinstance(tags[1], tag.Tag)
-    assert isinstance(tags[2], tag.Tag)
-
-    assert tags[0].name is not None
-    assert tags[0].name.value == "pet"
-    assert tags[1].name is not None
-    assert tags[1].name.value == "store"
-    assert tags[2].name is not None
-    assert tags[2].name.value == "user"
-
-    assert tags[0].description is not None
-    assert tags[0].description.value == "Everything about your Pets"
-    assert tags[1].description is not None
-    assert tags[1].description.value == "Access to Petstore orders"
-    assert tags[2].description is not None
-    assert tags[2].description.value == "Operations about user"
+    names_and_descriptions = []
+    for built in tags:
+        assert type(built) is tag.Tag
+        assert built.name is not None
+        assert built.description is not None
+        names_and_descriptions.append((built.name.value, built.description.value))
+
+    assert names_and_descriptions == [
+        ("pet", "Everything about your Pets"),
+        ("store", "Access to Petstore orders"),
+        ("user", "Operations about user"),
+    ]
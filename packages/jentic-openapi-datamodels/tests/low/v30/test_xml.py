@@ -1,89 +1,110 @@
 """Tests for XML low-level datamodel."""
 
-import textwrap
-
-from ruamel.yaml import YAML
+import pytest
 
 from jentic.apitools.openapi.datamodels.low.context import Context
 from jentic.apitools.openapi.datamodels.low.sources import FieldSource, KeySource, ValueSource
 from jentic.apitools.openapi.datamodels.low.v30 import xml
 
 
-def test_build_with_all_fields(parse_yaml):
-    """Test building XML with all specification fields."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        namespace: https://example.com/schema
-        prefix: ex
-        attribute: true
-        wrapped: false
-        """
-    )
+ALL_FIELDS_YAML = """
+name: id
+namespace: https://example.com/schema
+prefix: ex
+attribute: true
+wrapped: false
+"""
+
+MINIMAL_FIELDS_YAML = """
+name: id
+"""
+
+PRESERVES_INVALID_TYPES_YAML = """
+name: 123
+namespace: true
+attribute: not-a-boolean
+wrapped: 42
+"""
+
+EMPTY_OBJECT_YAML = """
+{}
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_fields"),
+    [
+        pytest.param(
+            ALL_FIELDS_YAML,
+            {
+                "name": "id",
+                "namespace": "https://example.com/schema",
+                "prefix": "ex",
+                "attribute": True,
+                "wrapped": False,
+            },
+            id="all-fields",
+        ),
+        pytest.param(
+            MINIMAL_FIELDS_YAML,
+            {"name": "id", "namespace": None, "prefix": None, "attribute": None, "wrapped": None},
+            id="minimal-fields",
+        ),
+        pytest.param(
+            PRESERVES_INVALID_TYPES_YAML,
+            {
+                "name": 123,
+                "namespace": True,
+                "prefix": None,
+                "attribute": "not-a-boolean",
+                "wrapped": 42,
+            },
+            id="preserves-invalid-types",
+        ),
+        pytest.param(
+            EMPTY_OBJECT_YAML,
+            {"name": None, "namespace": None, "prefix": None, "attribute": None, "wrapped": None},
+            id="empty-object",
+        ),
+    ],
+)
+def test_build_with_scalar_fields(parse_yaml, yaml_content, expected_fields):
+    """Test building XML whose fields are scalars, preserved as written, or absent."""
     root = parse_yaml(yaml_content)
 
     result = xml.build(root)
     assert isinstance(result, xml.XML)
 
     assert result.root_node == root
-
-    # Check all fields are FieldSource instances
-    assert isinstance(result.name, FieldSource)
-    assert result.name.value == "id"
-    assert result.name.key_node is not None
-    assert result.name.value_node is not None
-
-    assert isinstance(result.namespace, FieldSource)
-    assert result.namespace.value == "https://example.com/schema"
-
-    assert isinstance(result.prefix, FieldSource)
-    assert result.prefix.value == "ex"
-
-    assert isinstance(result.attribute, FieldSource)
-    assert result.attribute.value is True
-
-    assert isinstance(result.wrapped, FieldSource)
-    assert result.wrapped.value is False
-
-
-def test_build_with_minimal_fields(parse_yaml):
-    """Test building XML with only required fields."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = xml.build(root)
-    assert isinstance(result, xml.XML)
-
-    assert result.root_node == root
-    assert isinstance(result.name, FieldSource)
-    assert result.name.value == "id"
-
-    # Other fields should be None
-    assert result.namespace is None
-    assert result.prefix is None
-    assert result.attribute is None
-    assert result.wrapped is None
     # Extensions returns empty dict when no extensions present
     assert result.extensions == {}
 
+    for field_name, expected in expected_fields.items():
+        field = getattr(result, field_name)
+        if expected is None:
+            assert field is None, field_name
+        else:
+            assert isinstance(field, FieldSource), field_name
+            assert field.key_node is not None, field_name
+            assert field.value_node is not None, field_name
+            # Compare types too, so True/False are not satisfied by 1/0
+            assert type(field.value) is type(expected), field_name
+            assert field.value == expected, field_name
+
+
+EXTENSIONS_YAML = """
+name: id
+x-custom: custom-value
+x-internal: true
+x-array:
+  - item1
+  - item2
+"""
+
 
 def test_build_with_extensions(parse_yaml):
     """Test building XML with specification extensions (x-* fields)."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        x-custom: custom-value
-        x-internal: true
-        x-array:
-          - item1
-          - item2
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(EXTENSIONS_YAML)
 
     result = xml.build(root)
     assert isinstance(result, xml.XML)
@@ -92,9 +113,8 @@ def test_build_with_extensions(parse_yaml):
     assert len(result.extensions) == 3
 
     # Extensions should be dict[KeySource, ValueSource]
-    keys = list(result.extensions.keys())
-    assert all(isinstance(k, KeySource) for k in keys)
-    assert all(isinstance(v, ValueSource) for v in result.extensions.values())
+    assert {type(k) for k in result.extensions} == {KeySource}
+    assert {type(v) for v in result.extensions.values()} == {ValueSource}
 
     # Check extension values
     ext_dict = {k.value: v.value for k, v in result.extensions.items()}
@@ -103,79 +123,31 @@ def test_build_with_extensions(parse_yaml):
     assert ext_dict["x-array"] == ["item1", "item2"]
 
 
-def test_build_preserves_invalid_types(parse_yaml):
-    """Test that build preserves values even with 'wrong' types (low-level model principle)."""
-    yaml_content = textwrap.dedent(
-        """
-        name: 123
-        namespace: true
-        attribute: not-a-boolean
-        wrapped: 42
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = xml.build(root)
-    assert isinstance(result, xml.XML)
-
-    assert result.name is not None
-    assert result.namespace is not None
-    assert result.attribute is not None
-    assert result.wrapped is not None
-
-    # Should preserve the actual values, not convert them
-    assert result.name.value == 123
-    assert result.namespace.value is True
-    assert result.attribute.value == "not-a-boolean"
-    assert result.wrapped.value == 42
-
-
-def test_build_with_empty_object(parse_yaml):
-    """Test building XML from empty YAML object."""
-    yaml_content = "{}"
-    root = parse_yaml(yaml_content)
-
-    result = xml.build(root)
-    assert isinstance(result, xml.XML)
-
-    assert result.root_node == root
-    assert result.name is None
-    assert result.namespace is None
-    assert result.prefix is None
-    assert result.attribute is None
-    assert result.wrapped is None
-    # Extensions returns empty dict when no extensions present
-    assert result.extensions == {}
-
-
-def test_build_with_invalid_node_returns_none():
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_value"),
+    [
+        pytest.param("just-a-string", "just-a-string", id="scalar"),
+        pytest.param("['item1', 'item2']", ["item1", "item2"], id="sequence"),
+    ],
+)
+def test_build_with_invalid_node_returns_value_source(yaml_parser, yaml_content, expected_value):
     """Test that build returns ValueSource for non-mapping nodes (preserves invalid data)."""
-    yaml_parser = YAML()
-
-    # Scalar node
-    scalar_root = yaml_parser.compose("just-a-string")
-    result = xml.build(scalar_root)
+    root = yaml_parser.compose(yaml_content)
+    result = xml.build(root)
     assert isinstance(result, ValueSource)
-    assert result.value == "just-a-string"
-    assert result.value_node == scalar_root
+    assert result.value == expected_value
+    assert result.value_node == root
 
-    # Sequence node
-    sequence_root = yaml_parser.compose("['item1', 'item2']")
-    result = xml.build(sequence_root)
-    assert isinstance(result, ValueSource)
-    assert result.value == ["item1", "item2"]
-    assert result.value_node == sequence_root
+
+CUSTOM_CONTEXT_YAML = """
+name: id
+namespace: https://example.com/schema
+"""
 
 
 def test_build_with_custom_context(parse_yaml):
     """Test building XML with a custom context."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        namespace: https://example.com/schema
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(CUSTOM_CONTEXT_YAML)
 
     custom_context = Context()
     result = xml.build(root, context=custom_context)
@@ -187,65 +159,66 @@ def test_build_with_custom_context(parse_yaml):
     assert result.namespace.value == "https://example.com/schema"
 
 
+SOURCE_TRACKING_YAML = """
+name: id
+namespace: https://example.com/schema
+"""
+
+
 def test_source_tracking(parse_yaml):
     """Test that source location information is preserved."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        namespace: https://example.com/schema
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(SOURCE_TRACKING_YAML)
 
     result = xml.build(root)
     assert isinstance(result, xml.XML)
 
-    assert result.name is not None
+    name = result.name
+    assert name is not None
 
     # Check that key_node and value_node are tracked
-    assert result.name.key_node is not None
-    assert result.name.value_node is not None
+    key_node, value_node = name.key_node, name.value_node
+    assert key_node is not None
+    assert value_node is not None
 
     # The key_node should contain "name"
-    assert result.name.key_node.value == "name"
+    assert key_node.value == "name"
 
     # The value_node should contain "id"
-    assert result.name.value_node.value == "id"
+    assert value_node.value == "id"
 
     # Check line numbers are available (for error reporting)
-    assert hasattr(result.name.key_node.start_mark, "line")
-    assert hasattr(result.name.value_node.start_mark, "line")
+    assert isinstance(key_node.start_mark.line, int)
+    assert isinstance(value_node.start_mark.line, int)
+
+
+MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML = """
+name: id
+x-custom: value
+namespace: https://example.com/schema
+x-another: 123
+prefix: ex
+"""
 
 
 def test_mixed_extensions_and_fixed_fields(parse_yaml):
     """Test that extensions and fixed fields are properly separated."""
-    yaml_content = textwrap.dedent(
-        """
-        name: id
-        x-custom: value
-        namespace: https://example.com/schema
-        x-another: 123
-        prefix: ex
-        """
-    )
-    root = parse_yaml(yaml_content)
+    root = parse_yaml(MIXED_EXTENSIONS_AND_FIXED_FIELDS_YAML)
 
     result = xml.build(root)
     assert isinstance(result, xml.XML)
 
+    # Fixed fields should be present
     assert result.name is not None
     assert result.namespace is not None
     assert result.prefix is not None
 
-    # Fixed fields should be present
     assert result.name.value == "id"
     assert result.namespace.value == "https://example.com/schema"
     assert result.prefix.value == "ex"
 
     # Extensions should be in extensions dict
     assert result.extensions is not None
-    assert len(result.extensions) == 2
-
-    ext_dict = {k.value: v.value for k, v in result.extensions.items()}
-    assert ext_dict["x-custom"] == "value"
-    assert ext_dict["x-another"] == 123
+    assert [(k.value, v.value) for k, v in result.extensions.items()] == [
+        ("x-custom", "value"),
+        ("x-another", 123),
+    ]
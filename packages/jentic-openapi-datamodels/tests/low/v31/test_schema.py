@@ -2,6 +2,7 @@
 
 import textwrap
 
+import pytest
 from ruamel.yaml import YAML
 
 from jentic.apitools.openapi.datamodels.low.context import Context
@@ -15,16 +16,101 @@ from jentic.apitools.openapi.datamodels.low.v31.schema import Schema
 from jentic.apitools.openapi.datamodels.low.v31.xml import XML
 
 
-def test_build_with_primitive_string_schema(parse_yaml):
-    """Test building Schema with simple string type."""
-    yaml_content = textwrap.dedent(
-        """
-        type: string
-        minLength: 1
-        maxLength: 100
-        pattern: "^[a-zA-Z0-9]+$"
-        """
-    )
+PRIMITIVE_STRING_YAML = """
+type: string
+minLength: 1
+maxLength: 100
+pattern: "^[a-zA-Z0-9]+$"
+"""
+
+PRIMITIVE_NUMBER_YAML = """
+type: number
+format: float
+minimum: 0
+maximum: 100
+multipleOf: 0.5
+"""
+
+INTEGER_YAML = """
+type: integer
+format: int32
+minimum: 1
+maximum: 1000
+exclusiveMaximum: true
+"""
+
+EXCLUSIVE_MINIMUM_YAML = """
+type: integer
+format: int32
+minimum: 0
+maximum: 100
+exclusiveMinimum: true
+"""
+
+ADDITIONAL_PROPERTIES_BOOLEAN_YAML = """
+type: object
+additionalProperties: false
+"""
+
+DEPRECATED_YAML = """
+type: string
+deprecated: true
+"""
+
+DEFAULT_YAML = """
+type: string
+default: "N/A"
+"""
+
+
+@pytest.mark.parametrize(
+    ("yaml_content", "expected_fields"),
+    [
+        pytest.param(
+            PRIMITIVE_STRING_YAML,
+            {"type": "string", "min_length": 1, "max_length": 100, "pattern": "^[a-zA-Z0-9]+$"},
+            id="primitive-string",
+        ),
+        pytest.param(
+            PRIMITIVE_NUMBER_YAML,
+            {"type": "number", "format": "float", "minimum": 0, "maximum": 100, "multiple_of": 0.5},
+            id="primitive-number",
+        ),
+        pytest.param(
+            INTEGER_YAML,
+            {"type": "integer", "format": "int32", "exclusive_maximum": True},
+            id="integer",
+        ),
+        pytest.param(
+            EXCLUSIVE_MINIMUM_YAML,
+            {
+                "type": "integer",
+                "format": "int32",
+                "minimum": 0,
+                "maximum": 100,
+                "exclusive_minimum": True,
+            },
+            id="exclusive-minimum",
+        ),
+        pytest.param(
+            ADDITIONAL_PROPERTIES_BOOLEAN_YAML,
+            {"additional_properties": False},
+            id="additional-properties-boolean",
+        ),
+        pytest.param(
+            DEPRECATED_YAML,
+            {"deprecated": True},
+            id="deprecated",
+        ),
+        pytest.param(
+            DEFAULT_YAML,
+            {"default": "N/A"},
+            id="default",
+        ),
+    ],
+)
+def test_build_with_scalar_fields(parse_yaml, yaml_content, expected_fields):
+    """Test building Schema whose fields are plain scalar values."""
     root = parse_yaml(yaml_content)
 
     result = schema.build(root)
@@ -32,97 +118,13 @@ def test_build_with_primitive_string_schema(parse_yaml):
 
     assert result.root_node == root
 
-    # Check type field
-    assert isinstance(result.type, FieldSource)
-    assert result.type.value == "string"
-
-    # Check string validation fields
-    assert result.min_length is not None
-    assert result.min_length.value == 1
-    assert result.max_length is not None
-    assert result.max_length.value == 100
-    assert result.pattern is not None
-    assert result.pattern.value == "^[a-zA-Z0-9]+$"
-
-
-def test_build_with_primitive_number_schema(parse_yaml):
-    """Test building Schema with number type and numeric constraints."""
-    yaml_content = textwrap.dedent(
-        """
-        type: number
-        format: float
-        minimum: 0
-        maximum: 100
-        multipleOf: 0.5
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.type is not None
-    assert result.type.value == "number"
-    assert result.format is not None
-    assert result.format.value == "float"
-    assert result.minimum is not None
-    assert result.minimum.value == 0
-    assert result.maximum is not None
-    assert result.maximum.value == 100
-    assert result.multiple_of is not None
-    assert result.multiple_of.value == 0.5
-
-
-def test_build_with_integer_schema(parse_yaml):
-    """Test building Schema with integer type."""
-    yaml_content = textwrap.dedent(
-        """
-        type: integer
-        format: int32
-        minimum: 1
-        maximum: 1000
-        exclusiveMaximum: true
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.type is not None
-    assert result.type.value == "integer"
-    assert result.format is not None
-    assert result.format.value == "int32"
-    assert result.exclusive_maximum is not None
-    assert result.exclusive_maximum.value is True
-
-
-def test_build_with_exclusive_minimum(parse_yaml):
-    """Test building Schema with exclusiveMinimum validation."""
-    yaml_content = textwrap.dedent(
-        """
-        type: integer
-        format: int32
-        minimum: 0
-        maximum: 100
-        exclusiveMinimum: true
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.type is not None
-    assert result.type.value == "integer"
-    assert result.format is not None
-    assert result.format.value == "int32"
-    assert result.minimum is not None
-    assert result.minimum.value == 0
-    assert result.maximum is not None
-    assert result.maximum.value == 100
-    assert result.exclusive_minimum is not None
-    assert result.exclusive_minimum.value is True
+    for field_name, expected in expected_fields.items():
+        field = getattr(result, field_name)
+        assert isinstance(field, FieldSource), field_name
+        if isinstance(expected, bool):
+            assert field.value is expected, field_name
+        else:
+            assert field.value == expected, field_name
 
 
 def test_build_with_array_schema(parse_yaml):
@@ -473,23 +475,6 @@ def test_build_with_additional_properties_reference(parse_yaml):
     )  # In 3.1, nested schemas are Schema objects
 
 
-def test_build_with_additional_properties_boolean(parse_yaml):
-    """Test building Schema with additionalProperties as boolean."""
-    yaml_content = textwrap.dedent(
-        """
-        type: object
-        additionalProperties: false
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.additional_properties is not None
-    assert result.additional_properties.value is False
-
-
 def test_build_with_additional_properties_schema(parse_yaml):
     """Test building Schema with additionalProperties as schema."""
     yaml_content = textwrap.dedent(
@@ -648,40 +633,6 @@ def test_build_with_example(parse_yaml):
     assert result.example.value["name"] == "John Doe"
 
 
-def test_build_with_deprecated(parse_yaml):
-    """Test building Schema with deprecated flag."""
-    yaml_content = textwrap.dedent(
-        """
-        type: string
-        deprecated: true
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.deprecated is not None
-    assert result.deprecated.value is True
-
-
-def test_build_with_default(parse_yaml):
-    """Test building Schema with default value."""
-    yaml_content = textwrap.dedent(
-        """
-        type: string
-        default: "N/A"
-        """
-    )
-    root = parse_yaml(yaml_content)
-
-    result = schema.build(root)
-    assert isinstance(result, schema.Schema)
-
-    assert result.default is not None
-    assert result.default.value == "N/A"
-
-
 def test_build_with_title_and_description(parse_yaml):
     """Test building Schema with title and description."""
     yaml_content = textwrap.dedent(